@@ -0,0 +1,46 @@
+import be.ugent.rml.cli.Main;
+
+import java.io.BufferedReader;
+import java.io.ByteArrayInputStream;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+
+/**
+ * Long-lived RMLMapper process, so that the JVM start-up and class loading are
+ * paid once instead of once per mapping.
+ *
+ * Tasks are read from stdin, one per line, as "mapping_file\toutput_file".
+ * Each task is run through the RMLMapper command line entry point and answered
+ * on stdout with "OK" or "ERROR message". "READY" is printed once at start-up.
+ * The server stops when stdin is closed.
+ *
+ * Run it with the RMLMapper JAR on the class path:
+ *     java -cp rmlmapper.jar RMLMapperServer.java
+ */
+public class RMLMapperServer {
+    public static void main(String[] args) throws Exception {
+        BufferedReader tasks = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        PrintStream replies = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+
+        // Keep stdin and stdout for the protocol: RMLMapper only gets stderr and an empty stdin
+        System.setOut(System.err);
+        System.setIn(new ByteArrayInputStream(new byte[0]));
+
+        String basePath = System.getProperty("user.dir");
+        replies.println("READY");
+
+        String line;
+        while ((line = tasks.readLine()) != null) {
+            String[] task = line.split("\t");
+            try {
+                Main.run(new String[] {"-m", task[0], "-o", task[1]}, basePath);
+                replies.println("OK");
+            } catch (Exception e) {
+                replies.println("ERROR " + String.valueOf(e.getMessage()).replace('\n', ' '));
+            }
+        }
+    }
+}
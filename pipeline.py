@@ -4,8 +4,12 @@ from pipelineUtils import (
     load_config,
     clean_data,
     split_dataset,
+    iter_split_dataset,
     mapping,
     upload_rdf_data_to_graphdb,
+    map_and_upload,
+    list_files,
+    PipelineConfig,
 )
 
 
@@ -21,35 +25,59 @@ def main(config_path: str, clean: bool, split: bool, map: bool, upload: bool):
     if not config:
         logging.error("Failed to load configuration. Exiting.")
         return
+    try:
+        settings = PipelineConfig.from_dict(config)
+    except KeyError as e:
+        logging.error(f"Missing setting {e} in the configuration. Exiting.")
+        return
+
     if clean:
         # Step 1: Clean the data
         logging.info("Cleaning the data ...")
-        clean_data(config["clean_data"]["input"], config["clean_data"]["output"])
+        clean_data(settings.clean_input, settings.clean_output)
+
+    if map and upload:
+        # Steps 2 to 4: split, map and upload the data, each step working on the
+        # chunks and RDF files as soon as the previous step produces them
+        logging.info("Mapping and uploading the data ...")
+        if split:
+            csv_files = iter_split_dataset(
+                settings.split_input, settings.n_chunks, settings.chunk_dir
+            )
+        else:
+            csv_files = [entry.path for entry in list_files(settings.chunk_dir, ".csv")]
+        map_and_upload(
+            csv_files,
+            settings.rml_path,
+            settings.rdf_dir,
+            settings.mapper_path,
+            settings.graphdb_url,
+            settings.graphdb_repo,
+            import_dir=settings.graphdb_import_dir,
+        )
+        return
 
     if split:
         # Step 2: Split the dataset
         logging.info("Splitting the dataset ...")
-        split_dataset(
-            config["split_dataset"]["dataset_path"],
-            config["split_dataset"]["n_chunks"],
-            config["split_dataset"]["output_dir"],
-        )
+        split_dataset(settings.split_input, settings.n_chunks, settings.chunk_dir)
     if map:
         # Step 3: Perform RML Mapping
         logging.info("Mapping the data ...")
         mapping(
-            config["split_dataset"]["output_dir"],
-            config["mapping"]["rml_path"],
-            config["mapping"]["output_path"],
-            config["mapping"]["mapper_path"],
+            settings.chunk_dir,
+            settings.rml_path,
+            settings.rdf_dir,
+            settings.mapper_path,
         )
     if upload:
         # Step 4: Upload RDF Data to GraphDB
         logging.info("Uploading RDF data to GraphDB ...")
         upload_rdf_data_to_graphdb(
-            config["mapping"]["output_path"],
-            config["upload_to_graphDB"]["graphDB_url"],
-            config["upload_to_graphDB"]["graphDB_repo"],
+            settings.rdf_dir,
+            settings.graphdb_url,
+            settings.graphdb_repo,
+            import_dir=settings.graphdb_import_dir,
         )
 
 
@@ -58,6 +86,8 @@ if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
     )
+    # Keep the per-request logs of the HTTP client out of the pipeline output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
     # Setup argument parser
     parser = argparse.ArgumentParser(
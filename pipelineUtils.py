@@ -1,100 +1,298 @@
 """_summary_ = "This module contains functions to perform RML mapping using the RMLMapper JAR file.
 Functions:
-    - execute_rml(rml_file: str, output_file: str) -> None
-    - mapping(rml_dir: str, output_dir: str) -> None
+    - list_files(directory: str, suffix: str) -> list
+    - start_rml_server(rml_mapper_path: str) -> subprocess.Popen
+    - execute_rml(csv_file: str, rml_content: str, output_file: str, rml_mapper_path: str, rml_server: subprocess.Popen) -> None
+    - execute_rml_task(task: tuple) -> None
+    - mapping(rml_dir: str, output_dir: str, max_workers: int) -> None
     - upload(rdf_file_path: str, graphdb_url: str, repository: str) -> None
-    - upload_rdf_data_to_graphdb(rdf_file_path: str, graphdb_url: str, repository: str) -> None
-    - convert_to_iso8601(date_str: str) -> str
-    - clean_data(dataset_path: str, output_dir: str) -> pd.DataFrame
+    - import_server_files(graphdb_url: str, repository_id: str, rdf_files: list, import_dir: str) -> None
+    - upload_async(client: httpx.AsyncClient, graphdb_url: str, repository_id: str, rdf_file_path: str) -> None
+    - upload_batch_async(client: httpx.AsyncClient, graphdb_url: str, repository_id: str, rdf_files: list) -> None
+    - upload_rdf_data_to_graphdb(rdf_file_path: str, graphdb_url: str, repository: str, max_concurrency: int, batch_size: int, import_dir: str) -> None
+    - map_and_upload(csv_files: Iterable[str], rml_path: str, output_dir: str, mapper_path: str, graphdb_url: str, repository: str, max_workers: int, max_concurrency: int, import_dir: str) -> None
+    - clean_data(dataset_path: str, output_path: str, chunksize: int) -> None
+    - iter_split_dataset(dataset_path: str, n_chunks: int, output_dir: str) -> Iterator[str]
     - split_dataset(dataset_path: str, n_chunks: int, output_dir: str) -> None
     - load_config(config_file: str) -> dict
+Classes:
+    - PipelineConfig: the pipeline settings read from the configuration file
 """
 
 import os
 import subprocess
-import requests
+import copy
+import functools
+import itertools
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import httpx
 import pandas as pd
-from datetime import datetime
-import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+import orjson
 import logging
 import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Iterator
+
+# Java command and options shared by every RMLMapper run, passed as an argument list
+# so that no shell is spawned to parse them
+JAVA_COMMAND = (
+    "java",
+    "-Xms512m",  # Initial Java heap size
+    "-Xmx4g",  # Maximum Java heap size, kept low as several mappers run at once
+    "-XX:+UseG1GC",  # Use the G1 garbage collector for better memory management
+)
+
+# Path to the Java source of the long-lived RMLMapper process used by `mapping`
+RML_SERVER_SOURCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "RMLMapperServer.java"
+)
+
+# RMLMapper server of the current mapping worker process, see `_init_rml_worker`
+_rml_server = None
+
+# HTTP client shared by the synchronous uploads, so that their connections are pooled
+_client = httpx.Client(timeout=None)
+
+# Numbers removed from the register names to get the measured property
+_NUM_RE = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_rml(rml_file: str) -> str:
+    """
+    Reads an RML file template, caching its content so that the same template
+    is read from disk only once, however many CSV files it is applied to.
+
+    Args:
+        rml_file (str): The path to the RML file template.
+
+    Returns:
+        str: The content of the RML file template.
+    """
+    with open(rml_file, "r") as file:
+        return file.read()
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def list_files(directory: str, suffix: str) -> list:
+    """
+    Lists the files of a directory whose name ends with `suffix`, sorted by name.
+    Sub-directories and other files are skipped, so that they are never fed to RMLMapper or GraphDB.
+
+    Args:
+        directory (str): The directory to list.
+        suffix (str): The end of the names of the files to keep (e.g. ".csv").
+
+    Returns:
+        list: The `os.DirEntry` of each file, giving both its `name` and its `path`.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            (
+                entry
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            ),
+            key=lambda entry: entry.name,
+        )
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def start_rml_server(rml_mapper_path: str) -> subprocess.Popen:
+    """
+    Starts a long-lived RMLMapper JVM (see `RMLMapperServer.java`) that runs the mappings
+    sent to its stdin, so that the JVM start-up is paid once instead of once per mapping.
+
+    Args:
+        rml_mapper_path (str): The path to the RMLMapper JAR file.
+
+    Returns:
+        subprocess.Popen: The server process, or None if it could not be started.
+    """
+    # Arguments to pass to the Java command for running the RMLMapper server
+    args = [
+        *JAVA_COMMAND,
+        "-cp",
+        rml_mapper_path,  # Put the RMLMapper JAR file on the class path
+        RML_SERVER_SOURCE,  # Run the server straight from its Java source
+    ]
+
+    try:
+        server = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+    except OSError as e:
+        logging.error(f"Could not start the RMLMapper server: {e}")
+        return None
+
+    # The server announces itself once the RMLMapper classes are loaded
+    if server.stdout.readline().strip() != "READY":
+        logging.error("Could not start the RMLMapper server, using one JVM per mapping")
+        server.kill()
+        server.wait()
+        return None
+
+    return server
+
+
+# ---------------------------------------------------------------------------------------------------------------
 
 
 def execute_rml(
-    csv_file: str, rml_file: str, output_file: str, rml_mapper_path: str
-) -> None:
+    csv_file: str,
+    rml_content: str,
+    output_file: str,
+    rml_mapper_path: str,
+    rml_server: subprocess.Popen = None,
+) -> bool:
     """
-    Executes an RML mapping by injecting the CSV file path into the RML file
+    Executes an RML mapping by injecting the CSV file path into the RML template
     and running the RMLMapper Java application.
 
     Args:
         csv_file (str): The path to the CSV file to be used in the RML mapping.
-        rml_file (str): The path to the RML file template containing the mapping rules.
+        rml_content (str): The content of the RML file template containing the mapping rules.
         output_file (str): The path where the output RDF file should be saved.
         rml_mapper_path (str): The path to the RMLMapper JAR file.
+        rml_server (subprocess.Popen, optional): A running RMLMapper server, as returned by
+            `start_rml_server`, to hand the mapping to. If None, a new JVM is started.
 
     Returns:
-        None
+        bool: Whether the mapping succeeded.
 
     Raises:
         subprocess.CalledProcessError: If the RML mapping process fails.
     """
     # ----------------- ADD CSV PATH TO RML FILE -----------------
-    # Read the content of the RML file
-    with open(rml_file, "r") as file:
-        rml_content = file.read()
-
     # Replace the placeholder "{csv_file_path}" in the RML content with the actual CSV file path
-    rml_content = rml_content.replace("{csv_file_path}", csv_file)
+    rml_content = rml_content.replace("{csv_file_path}", os.fspath(csv_file))
 
-    # Write the modified RML content to a temporary file for processing
-    tmp_rml_file = "tmp_mapping.rml.ttl"
-    with open(tmp_rml_file, "w") as file:
+    # Write the modified RML content to a uniquely named temporary file, so that concurrent
+    # mappings never share the same RML file. It is kept out of the output directory, whose
+    # Turtle files are all uploaded, in case it is left behind by a killed mapping
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".rml.ttl", delete=False) as file:
         file.write(rml_content)
+        tmp_rml_file = file.name
 
     # ----------------------------------------------------------
 
     # ----------------- RUN RML MAPPING --------------------------
 
-    # Arguments to pass to the Java command for running the RMLMapper
-    args = [
-        "-Xms512m",  # Initial Java heap size
-        "-Xmx10g",  # Maximum Java heap size
-        "-XX:+UseG1GC",  # Use the G1 garbage collector for better memory management
-        f"-jar {rml_mapper_path}",  # Specify the path to the RMLMapper JAR file
-        f"-m {tmp_rml_file}",  # Specify the RML mapping file to use
-        f"-o {output_file}",  # Specify the output file path
-    ]
-
-    # Construct the complete Java command to run the RMLMapper
-    command = f"java {' '.join(args)}"
-
-    # Run the Java command in a subprocess and capture the output
     try:
-        subprocess.run(command, capture_output=True, text=True, check=True, shell=True)
+        if rml_server is not None:
+            # Hand the mapping over to the already running RMLMapper JVM
+            rml_server.stdin.write(f"{tmp_rml_file}\t{output_file}\n")
+            rml_server.stdin.flush()
+            reply = rml_server.stdout.readline().strip()
+            if reply != "OK":
+                logging.error(f"Error: {reply or 'the RMLMapper server stopped'}")
+                return False
+        else:
+            # Arguments to pass to the Java command for running the RMLMapper
+            args = [
+                *JAVA_COMMAND,
+                "-jar",
+                rml_mapper_path,  # Specify the path to the RMLMapper JAR file
+                "-m",
+                tmp_rml_file,  # Specify the RML mapping file to use
+                "-o",
+                output_file,  # Specify the output file path
+            ]
+
+            # Run the Java command in a subprocess and capture the output
+            subprocess.run(args, capture_output=True, text=True, check=True)
     except subprocess.CalledProcessError as e:
         # Print the error if the command fails
         logging.error(f"Error: {e.returncode}, {e.stderr}")
+        return False
+    except BrokenPipeError:
+        logging.error("Error: the RMLMapper server stopped")
+        return False
+    finally:
+        # Clean up the temporary RML file after execution, even if it failed
+        os.remove(tmp_rml_file)
 
-    # Clean up the temporary RML file after execution
-    os.remove(tmp_rml_file)
+    return True
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def _init_rml_worker(rml_mapper_path: str) -> None:
+    """
+    Starts the RMLMapper server of a mapping worker process. The server stops on its
+    own when the worker exits, as its stdin is then closed.
+
+    Args:
+        rml_mapper_path (str): The path to the RMLMapper JAR file.
+
+    Returns:
+        None
+    """
+    global _rml_server
+    _rml_server = start_rml_server(rml_mapper_path)
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def execute_rml_task(task: tuple) -> bool:
+    """
+    Unpacks a mapping task and runs it with `execute_rml` on the RMLMapper server of
+    the current worker process, so that it can be dispatched through `ProcessPoolExecutor.map`.
+
+    Args:
+        task (tuple): A `(csv_file, rml_content, output_file, rml_mapper_path)` tuple.
+
+    Returns:
+        bool: Whether the mapping succeeded.
+    """
+    global _rml_server
+    csv_file, rml_content, output_file, rml_mapper_path = task
+
+    # Restart the server if a previous mapping brought it down
+    if _rml_server is not None and _rml_server.poll() is not None:
+        _rml_server = start_rml_server(rml_mapper_path)
+
+    return execute_rml(csv_file, rml_content, output_file, rml_mapper_path, _rml_server)
 
 
 # ---------------------------------------------------------------------------------------------------------------
 
 
 def mapping(
-    csv_file_path: str, rml_path: str, output_dir: str, mapper_path: str
+    csv_file_path: str,
+    rml_path: str,
+    output_dir: str,
+    mapper_path: str,
+    max_workers: int = None,
 ) -> None:
     """
     Applies RML mapping to either a single CSV file or multiple CSV files within a directory.
-    It uses the `execute_rml` function to perform the mapping for each file.
+    The CSV/RML pairs are mapped in parallel by worker processes, each one running its
+    mappings on a single long-lived RMLMapper JVM.
 
     Args:
         csv_file_path (str): The path to a single CSV file or a directory containing CSV files.
         rml_path (str): The path to the RML file template containing the mapping rules.
         output_dir (str): The directory where the output RDF files should be saved.
         mapper_path (str): The path to the RMLMapper JAR file.
+        max_workers (int, optional): The number of mappings to run at once. Defaults to half
+            of the CPU count, since each RMLMapper JVM is itself multi-threaded.
 
     Returns:
         None
@@ -110,26 +308,41 @@ def mapping(
             "../rmlmapper.jar",
         )
     """
+    # Collect the (csv, rml content, output, mapper) tuples to be processed,
+    # each RML template being read once rather than once per CSV file
+    tasks = []
+
     # Check if the provided CSV file path is a directory
     if os.path.isdir(rml_path):
-        for j, rml_file in enumerate(os.listdir(rml_path)):
+        for j, rml_file in enumerate(list_files(rml_path, ".ttl")):
             if os.path.isdir(csv_file_path):
                 # ---------------------- RML and CSV are folders----------------------
-                for i, csv_file in enumerate(os.listdir(csv_file_path)):
-                    # Execute the RML mapping for each CSV file in the directory
-                    logging.info(f"Processing file: {csv_file}, RML: {rml_file}")
-                    execute_rml(
-                        f"{csv_file_path}{csv_file}",
-                        f"{rml_path}{rml_file}",
-                        f"{output_dir}output_{i}_{j}.ttl",
-                        mapper_path,
+                for i, csv_file in enumerate(list_files(csv_file_path, ".csv")):
+                    # Map each CSV file in the directory
+                    logging.info(
+                        f"Processing file: {csv_file.name}, RML: {rml_file.name}"
+                    )
+                    tasks.append(
+                        (
+                            csv_file.path,
+                            _load_rml(rml_file.path),
+                            os.path.join(output_dir, f"output_{i}_{j}.ttl"),
+                            mapper_path,
+                        )
                     )
             # Check if the provided path is a single file
             elif os.path.isfile(csv_file_path):
                 # ---------------------- RML is a folder and CSV a file ----------------------
-                # Execute the RML mapping for the single CSV file
-                execute_rml(
-                    csv_file_path, f"{rml_path}{rml_file}", output_dir, mapper_path
+                # Map the single CSV file, each RML template to its own output file as
+                # the mappings run at the same time
+                logging.info(f"Processing file: {csv_file_path}, RML: {rml_file.name}")
+                tasks.append(
+                    (
+                        csv_file_path,
+                        _load_rml(rml_file.path),
+                        os.path.join(output_dir, f"output_{j}.ttl"),
+                        mapper_path,
+                    )
                 )
             else:
                 # If the path is neither a file nor a directory, print an error message
@@ -139,24 +352,39 @@ def mapping(
 
         if os.path.isdir(csv_file_path):
             # ---------------------- RML and CSV are folders----------------------
-            for i, csv_file in enumerate(os.listdir(csv_file_path)):
-                # Execute the RML mapping for each CSV file in the directory
-                logging.info(f"Processing file: {csv_file}, RML: {rml_file}")
-                execute_rml(
-                    f"{csv_file_path}{csv_file}",
-                    rml_path,
-                    f"{output_dir}output_{i}.ttl",
-                    mapper_path,
+            for i, csv_file in enumerate(list_files(csv_file_path, ".csv")):
+                # Map each CSV file in the directory
+                logging.info(f"Processing file: {csv_file.name}, RML: {rml_path}")
+                tasks.append(
+                    (
+                        csv_file.path,
+                        _load_rml(rml_path),
+                        os.path.join(output_dir, f"output_{i}.ttl"),
+                        mapper_path,
+                    )
                 )
         # Check if the provided path is a single file
         elif os.path.isfile(csv_file_path):
             # ---------------------- RML and CSV are files ----------------------
-            # Execute the RML mapping for the single CSV file
-            execute_rml(csv_file_path, rml_path, output_dir, mapper_path)
+            # Map the single CSV file
+            tasks.append((csv_file_path, _load_rml(rml_path), output_dir, mapper_path))
         else:
             # If the path is neither a file nor a directory, print an error message
             logging.error("Invalid CSV file path")
 
+    if not tasks:
+        return
+
+    # Run the RML mappings in parallel, each worker process keeping its own RMLMapper JVM
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(tasks)),
+        initializer=_init_rml_worker,
+        initargs=(mapper_path,),
+    ) as executor:
+        list(executor.map(execute_rml_task, tasks))
+
 
 # ---------------------------------------------------------------------------------------------------------------
 
@@ -178,12 +406,9 @@ def upload(graphdb_url: str, repository_id: str, rdf_file_path: str) -> None:
     # Set the headers
     headers = {"Content-Type": "text/turtle"}
 
-    # Read the Turtle file
-    with open(rdf_file_path, "r") as file:
-        rdf_data = file.read()
-
-    # Send the POST request
-    response = requests.post(url, headers=headers, data=rdf_data)
+    # Send the POST request, streaming the Turtle file instead of reading it in memory
+    with open(rdf_file_path, "rb") as file:
+        response = _client.post(url, headers=headers, content=file)
     if response.status_code == 204:
         logging.info(
             f"RDF file {rdf_file_path} uploaded to repository {repository_id}."
@@ -197,28 +422,322 @@ def upload(graphdb_url: str, repository_id: str, rdf_file_path: str) -> None:
 # ---------------------------------------------------------------------------------------------------------------
 
 
+def import_server_files(
+    graphdb_url: str, repository_id: str, rdf_files: list, import_dir: str
+) -> None:
+    """
+    Asks GraphDB to load RDF files straight from its server-side import directory, so that the
+    data is parsed by the server from its own disk instead of being streamed over HTTP.
+    The RDF files must be inside the import directory of GraphDB (`graphdb.workbench.importDirectory`).
+    GraphDB runs the import in the background: its progress is shown in the Import view of the Workbench.
+
+    Args:
+        graphdb_url (str): The base URL of the GraphDB instance (e.g., http://localhost:7200).
+        repository_id (str): The ID of the repository in GraphDB where the data will be loaded.
+        rdf_files (list): Paths to the Turtle files to load, inside `import_dir`.
+        import_dir (str): Path to the import directory of GraphDB.
+    Returns:
+        None
+    """
+    # GraphDB identifies the files by their path relative to its import directory
+    file_names = []
+    for rdf_file in rdf_files:
+        file_name = os.path.relpath(rdf_file, import_dir)
+        if file_name.startswith(os.pardir):
+            logging.error(
+                f"RDF file {rdf_file} is not in the GraphDB import directory {import_dir}."
+            )
+        else:
+            file_names.append(Path(file_name).as_posix())
+    if not file_names:
+        return
+
+    # Construct the full URL of the server-side import of the repository
+    url = f"{graphdb_url}/rest/repositories/{repository_id}/import/server"
+
+    # Send the names of the files to import, GraphDB answers as soon as the import is started
+    try:
+        response = _client.post(url, json={"fileNames": file_names})
+        if response.is_success:
+            logging.info(
+                f"Import of {len(file_names)} RDF files started on repository {repository_id}."
+            )
+        else:
+            logging.error(
+                f"Failed to import RDF files {file_names}. Response: {response.text}"
+            )
+    except httpx.HTTPError as e:
+        logging.error(f"Failed to import RDF files {file_names}. Error: {e}")
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+async def _stream_file(file_path: str) -> AsyncIterator[bytes]:
+    """
+    Reads a file in 1 MB blocks from a worker thread, so that it can be sent as a request
+    body without being loaded in memory nor blocking the event loop.
+
+    Args:
+        file_path (str): The path of the file to read.
+
+    Yields:
+        bytes: The successive blocks of the file.
+    """
+    with open(file_path, "rb") as file:
+        while block := await asyncio.to_thread(file.read, 1 << 20):
+            yield block
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def _async_client(max_concurrency: int) -> httpx.AsyncClient:
+    """
+    Creates the HTTP client of the concurrent uploads. HTTP/2 is negotiated with HTTPS
+    servers, multiplexing the uploads over few connections, and the connections are
+    kept alive between requests.
+
+    Args:
+        max_concurrency (int): The maximum number of simultaneous uploads.
+
+    Returns:
+        httpx.AsyncClient: The client, to be used as an async context manager.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=max_concurrency, keepalive_expiry=60),
+        timeout=None,
+    )
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+async def upload_async(
+    client: httpx.AsyncClient,
+    graphdb_url: str,
+    repository_id: str,
+    rdf_file_path: str,
+) -> None:
+    """
+    Uploads RDF data in Turtle format to a GraphDB repository without blocking the event loop,
+    so that several files can be uploaded at once over the connections of a shared client.
+
+    Args:
+        client (httpx.AsyncClient): The client used to send the request.
+        graphdb_url (str): The base URL of the GraphDB instance (e.g., http://localhost:7200).
+        repository_id (str): The ID of the repository in GraphDB where the data will be uploaded.
+        rdf_file_path (str): Path to the Turtle file containing RDF data.
+    Returns:
+        None
+    """
+    # Construct the full URL for the POST request
+    url = f"{graphdb_url}/repositories/{repository_id}/statements"
+
+    # Set the headers
+    headers = {"Content-Type": "text/turtle"}
+
+    # Send the POST request, streaming the file from disk
+    try:
+        response = await client.post(
+            url, headers=headers, content=_stream_file(rdf_file_path)
+        )
+        if response.status_code == 204:
+            logging.info(
+                f"RDF file {rdf_file_path} uploaded to repository {repository_id}."
+            )
+        else:
+            logging.error(
+                f"Failed to upload RDF file {rdf_file_path}. Response: {response.text}"
+            )
+    except (httpx.HTTPError, OSError) as e:
+        logging.error(f"Failed to upload RDF file {rdf_file_path}. Error: {e}")
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+async def upload_batch_async(
+    client: httpx.AsyncClient,
+    graphdb_url: str,
+    repository_id: str,
+    rdf_files: list,
+) -> None:
+    """
+    Uploads several Turtle files to a GraphDB repository within a single RDF4J transaction,
+    so that GraphDB commits them once instead of once per file. Each file is still sent
+    and parsed on its own, hence blank nodes of different files are never merged.
+
+    Args:
+        client (httpx.AsyncClient): The client used to send the requests.
+        graphdb_url (str): The base URL of the GraphDB instance (e.g., http://localhost:7200).
+        repository_id (str): The ID of the repository in GraphDB where the data will be uploaded.
+        rdf_files (list): Paths to the Turtle files containing RDF data.
+    Returns:
+        None
+    """
+    # Set the headers
+    headers = {"Content-Type": "text/turtle"}
+
+    transaction_url = None
+    try:
+        # Open the transaction, GraphDB answers with its URL
+        response = await client.post(
+            f"{graphdb_url}/repositories/{repository_id}/transactions"
+        )
+        if not response.is_success:
+            logging.error(
+                f"Failed to open a transaction on repository {repository_id}. Response: {response.text}"
+            )
+            return
+        transaction_url = response.headers["Location"]
+
+        # Add each file to the transaction, streaming it from disk
+        for rdf_file in rdf_files:
+            response = await client.put(
+                transaction_url,
+                params={"action": "ADD"},
+                headers=headers,
+                content=_stream_file(rdf_file),
+            )
+            if not response.is_success:
+                raise httpx.HTTPError(f"{rdf_file} was rejected: {response.text}")
+
+        # Commit all the files at once
+        response = await client.put(transaction_url, params={"action": "COMMIT"})
+        if not response.is_success:
+            raise httpx.HTTPError(response.text)
+
+        logging.info(
+            f"RDF files {', '.join(rdf_files)} uploaded to repository {repository_id}."
+        )
+    except (httpx.HTTPError, OSError) as e:
+        logging.error(f"Failed to upload RDF files {', '.join(rdf_files)}. Error: {e}")
+        # Roll back whatever was added to the transaction
+        if transaction_url is not None:
+            try:
+                await client.delete(transaction_url)
+            except httpx.HTTPError:
+                pass
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def _batch_files(rdf_files: list, batch_size: int) -> list:
+    """
+    Groups files into batches whose total size stays below `batch_size` bytes.
+    A file larger than `batch_size` makes up a batch of its own.
+
+    Args:
+        rdf_files (list): The paths of the files to group.
+        batch_size (int): The maximum size of a batch, in bytes.
+
+    Returns:
+        list: The batches, each one a list of file paths.
+    """
+    batches = []
+    batch, size = [], 0
+    for rdf_file in rdf_files:
+        file_size = os.path.getsize(rdf_file)
+        if batch and size + file_size > batch_size:
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(rdf_file)
+        size += file_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+async def _upload_files(
+    graphdb_url: str,
+    repository_id: str,
+    rdf_files: list,
+    max_concurrency: int,
+    batch_size: int,
+) -> None:
+    """
+    Uploads several RDF files to a GraphDB repository in batches of about `batch_size` bytes,
+    each committed in one transaction. At most `max_concurrency` batches are in flight and
+    their connections are kept alive between requests.
+
+    Args:
+        graphdb_url (str): The base URL of the GraphDB instance.
+        repository_id (str): The ID of the repository in GraphDB where the data will be uploaded.
+        rdf_files (list): The paths of the Turtle files to upload.
+        max_concurrency (int): The maximum number of simultaneous uploads.
+        batch_size (int): The maximum size of a batch, in bytes.
+
+    Returns:
+        None
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with _async_client(max_concurrency) as client:
+
+        async def bounded_upload(batch: list) -> None:
+            async with semaphore:
+                logging.info(f"Uploading files: {', '.join(batch)}")
+                await upload_batch_async(client, graphdb_url, repository_id, batch)
+
+        await asyncio.gather(
+            *(bounded_upload(batch) for batch in _batch_files(rdf_files, batch_size))
+        )
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
 def upload_rdf_data_to_graphdb(
-    rdf_file_path: str, graphdb_url: str, repository: str
+    rdf_file_path: str,
+    graphdb_url: str,
+    repository: str,
+    max_concurrency: int = 16,
+    batch_size: int = 64 * 1024 * 1024,
+    import_dir: str = None,
 ) -> None:
     """
     Uploads RDF data from a file or directory to a GraphDB repository.
+    The files of a directory are uploaded concurrently, in batches committed in one transaction each.
+    When `import_dir` is given, the files are instead loaded by GraphDB from its import directory.
 
     Args:
         rdf_file_path (str): Path to a directory containing RDF files or a single RDF file.
         graphdb_url (str): Base URL of the GraphDB server.
         repository (str): Name of the GraphDB repository to which the RDF data should be uploaded.
+        max_concurrency (int, optional): The maximum number of simultaneous uploads. Defaults to 16.
+        batch_size (int, optional): The maximum size in bytes of the files uploaded in one
+            transaction. Defaults to 64 MB.
+        import_dir (str, optional): Path to the import directory of GraphDB, containing
+            `rdf_file_path`, to load the files with a server-side import. Defaults to None.
 
     Returns:
         None
     """
     # Check if the provided path is a directory
     if os.path.isdir(rdf_file_path):
-        for file in os.listdir(rdf_file_path):
-            logging.info(f"Uploading file: {file}")
-            # Upload each RDF file in the directory
-            upload(graphdb_url, repository, os.path.join(rdf_file_path, file))
+        rdf_files = [entry.path for entry in list_files(rdf_file_path, ".ttl")]
+        if import_dir is not None:
+            # Let GraphDB load all the RDF files of the directory from its own disk
+            import_server_files(graphdb_url, repository, rdf_files, import_dir)
+            return
+        # Upload all the RDF files in the directory concurrently, in batches
+        asyncio.run(
+            _upload_files(
+                graphdb_url, repository, rdf_files, max_concurrency, batch_size
+            )
+        )
     # Check if the provided path is a file
     elif os.path.isfile(rdf_file_path):
+        if import_dir is not None:
+            # Let GraphDB load the single RDF file from its own disk
+            import_server_files(graphdb_url, repository, [rdf_file_path], import_dir)
+            return
         # Upload the single RDF file
         upload(graphdb_url, repository, rdf_file_path)
     else:
@@ -229,48 +748,196 @@ def upload_rdf_data_to_graphdb(
 # ---------------------------------------------------------------------------------------------------------------
 
 
-def convert_to_iso8601(date_str: str) -> str:
+async def _map_and_upload(
+    csv_files: Iterable[str],
+    rml_path: str,
+    output_dir: str,
+    mapper_path: str,
+    graphdb_url: str,
+    repository_id: str,
+    max_workers: int,
+    max_concurrency: int,
+    import_dir: str,
+) -> None:
     """
-    Convert a date string in the format '%Y-%m-%d %H:%M:%S.%f' to ISO 8601 format.
+    Coroutine behind `map_and_upload`: CSV files are pulled from `csv_files` in a thread, their
+    mappings run in a process pool and the resulting RDF files go through a bounded queue to
+    `max_concurrency` upload workers.
 
     Args:
-        date_str (str): The date string to convert.
+        csv_files (Iterable[str]): The CSV files to map, possibly produced while they are mapped.
+        rml_path (str): The path to the RML file template, or to a directory of templates.
+        output_dir (str): The directory where the output RDF files should be saved.
+        mapper_path (str): The path to the RMLMapper JAR file.
+        graphdb_url (str): The base URL of the GraphDB instance.
+        repository_id (str): The ID of the repository in GraphDB where the data will be uploaded.
+        max_workers (int): The number of mappings to run at once.
+        max_concurrency (int): The maximum number of simultaneous uploads.
+        import_dir (str): Path to the import directory of GraphDB, to load the RDF files with a
+            server-side import, or None to upload them over HTTP.
 
     Returns:
-        str: The date string in ISO 8601 format.
+        None
     """
-    # Parse the input date string to a datetime object
-    date_obj = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S.%f")
-    # Format the datetime object to the desired ISO 8601 format
-    return date_obj.isoformat()
+    loop = asyncio.get_running_loop()
 
+    if os.path.isdir(rml_path):
+        rml_files = [entry.path for entry in list_files(rml_path, ".ttl")]
+    else:
+        rml_files = [rml_path]
+
+    # Bounded stages: at most 2 mappings per worker are queued ahead of the split, and
+    # mapping waits for the uploads once 2 RDF files per upload worker are pending
+    mapping_slots = asyncio.Semaphore(2 * max_workers)
+    rdf_files = asyncio.Queue(maxsize=2 * max_concurrency)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_rml_worker,
+        initargs=(mapper_path,),
+    ) as executor:
+        async with _async_client(max_concurrency) as client:
+
+            async def upload_worker() -> None:
+                while (rdf_file := await rdf_files.get()) is not None:
+                    logging.info(f"Uploading file: {rdf_file}")
+                    # Keep draining the queue whatever happens to one file, otherwise
+                    # the mappings would wait forever for room in the queue
+                    try:
+                        if import_dir is not None:
+                            await asyncio.to_thread(
+                                import_server_files,
+                                graphdb_url,
+                                repository_id,
+                                [rdf_file],
+                                import_dir,
+                            )
+                        else:
+                            await upload_async(
+                                client, graphdb_url, repository_id, rdf_file
+                            )
+                    except Exception as e:
+                        logging.error(
+                            f"Failed to upload RDF file {rdf_file}. Error: {e}"
+                        )
+
+            async def map_worker(task: tuple) -> None:
+                # Keep the mapping slot until the RDF file is queued, so that no new
+                # mapping starts while the uploads are behind
+                try:
+                    succeeded = await loop.run_in_executor(
+                        executor, execute_rml_task, task
+                    )
+                    if succeeded:
+                        await rdf_files.put(task[2])
+                finally:
+                    mapping_slots.release()
+
+            uploads = [
+                asyncio.create_task(upload_worker()) for _ in range(max_concurrency)
+            ]
+
+            # Start mapping every CSV file as soon as it is available
+            mappings = []
+            csv_iterator = iter(csv_files)
+            i = 0
+            while (
+                csv_file := await loop.run_in_executor(None, next, csv_iterator, None)
+            ) is not None:
+                for j, rml_file in enumerate(rml_files):
+                    logging.info(f"Processing file: {csv_file}, RML: {rml_file}")
+                    if os.path.isdir(rml_path):
+                        output_file = os.path.join(output_dir, f"output_{i}_{j}.ttl")
+                    else:
+                        output_file = os.path.join(output_dir, f"output_{i}.ttl")
+                    await mapping_slots.acquire()
+                    task = (csv_file, _load_rml(rml_file), output_file, mapper_path)
+                    mappings.append(asyncio.create_task(map_worker(task)))
+                i += 1
 
-# ---------------------------------------------------------------------------------------------------------------
+            await asyncio.gather(*mappings)
 
-# Function to remove numbers
-def remove_numbers(text):
-    return re.sub(r"\d+", "", text)
+            # Stop the upload workers once every RDF file is queued
+            for _ in uploads:
+                await rdf_files.put(None)
+            await asyncio.gather(*uploads)
 
 
 # ---------------------------------------------------------------------------------------------------------------
 
 
-def clean_data(dataset_path: str, output_path: str) -> None:
+def map_and_upload(
+    csv_files: Iterable[str],
+    rml_path: str,
+    output_dir: str,
+    mapper_path: str,
+    graphdb_url: str,
+    repository: str,
+    max_workers: int = None,
+    max_concurrency: int = 16,
+    import_dir: str = None,
+) -> None:
     """
-    Cleans the dataset by converting dates to ISO 8601 format, replacing specific unit values, and standardizing quality descriptions.
+    Maps CSV files to RDF and uploads the RDF files to a GraphDB repository, overlapping the
+    stages instead of running them one after the other: a CSV file is mapped as soon as
+    `csv_files` yields it (e.g. while `iter_split_dataset` writes the next chunk), and an RDF
+    file is uploaded as soon as its mapping is done, while the other mappings go on.
 
     Args:
-        dataset_path (str): The path to the CSV dataset file to clean.
-        output_dir (str): The directory where the cleaned dataset should be saved.
+        csv_files (Iterable[str]): The CSV files to map.
+        rml_path (str): The path to the RML file template, or to a directory of templates.
+        output_dir (str): The directory where the output RDF files should be saved.
+        mapper_path (str): The path to the RMLMapper JAR file.
+        graphdb_url (str): Base URL of the GraphDB server.
+        repository (str): Name of the GraphDB repository to which the RDF data should be uploaded.
+        max_workers (int, optional): The number of mappings to run at once. Defaults to half
+            of the CPU count, since each RMLMapper JVM is itself multi-threaded.
+        max_concurrency (int, optional): The maximum number of simultaneous uploads. Defaults to 16.
+        import_dir (str, optional): Path to the import directory of GraphDB, containing
+            `output_dir`, to load the RDF files with a server-side import. Defaults to None.
 
     Returns:
-        pd.DataFrame: The cleaned dataset.
+        None
+    """
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    asyncio.run(
+        _map_and_upload(
+            csv_files,
+            rml_path,
+            output_dir,
+            mapper_path,
+            graphdb_url,
+            repository,
+            max_workers,
+            max_concurrency,
+            import_dir,
+        )
+    )
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def _clean_chunk(data: pd.DataFrame) -> None:
     """
-    # Load the dataset
-    data = pd.read_csv(dataset_path, low_memory=False)
+    Cleans, in place, a chunk of rows of the dataset read by `clean_data`.
 
-    # Convert the 'data_rilevazione' column to ISO 8601 format
-    data["data_rilevazione"] = data["data_rilevazione"].apply(convert_to_iso8601)
+    Args:
+        data (pd.DataFrame): The chunk of rows to clean.
+
+    Returns:
+        None
+    """
+    # Convert the 'data_rilevazione' column to ISO 8601 format in a single vectorized
+    # pass, writing the microseconds only when they are not zero (as `isoformat` does)
+    dates = pd.to_datetime(
+        data["data_rilevazione"], format="%Y-%m-%d %H:%M:%S.%f", cache=True
+    )
+    iso_dates = dates.dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
+    data["data_rilevazione"] = iso_dates.mask(
+        dates.dt.microsecond == 0, iso_dates.str[:-7]
+    )
 
     # Replace "-" with "Dimensionless" in the 'unit' column
     data["unit"] = data["unit"].replace("-", "Dimensionless")
@@ -278,55 +945,218 @@ def clean_data(dataset_path: str, output_path: str) -> None:
     # Standardize the quality descriptions
     data["quality"] = data["quality"].replace("Qualità della misura: ", "", regex=True)
 
-    # Apply function to DataFrame column
-    data["property"] = data["register_name"].apply(remove_numbers)
-    data["property"] = data["property"].str.replace(
-        r"^Current.*", "Current", regex=True
-    )
+    # Remove the numbers from the register names and group all the currents
+    # under a single property, assigning the column only once
+    names = data["register_name"].str.replace(_NUM_RE, "", regex=True)
+    data["property"] = names.mask(names.str.startswith("Current", na=False), "Current")
 
-    # Display the DataFrame
-    data["property"].unique()
 
-    # Save the cleaned dataset to the specified output directory
-    data.to_csv(output_path, index=False)
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def clean_data(dataset_path: str, output_path: str, chunksize: int = 200_000) -> None:
+    """
+    Cleans the dataset by converting dates to ISO 8601 format, replacing specific unit values, and standardizing quality descriptions.
+    The dataset is streamed in chunks of rows, so that it never has to fit in memory as a whole.
+    If `output_path` ends with ".parquet", the cleaned dataset is saved as a Zstandard-compressed
+    Parquet file with one row group per chunk and text columns, otherwise as a CSV file.
+
+    Args:
+        dataset_path (str): The path to the CSV dataset file to clean.
+        output_path (str): The path where the cleaned dataset should be saved.
+        chunksize (int, optional): The number of rows cleaned at a time. Defaults to 200 000.
+
+    Returns:
+        None
+    """
+    to_parquet = os.fspath(output_path).endswith(".parquet")
+
+    # Stream the dataset, keeping every column as the text read from it. pandas would
+    # infer the column types per chunk (e.g. an integer column with missing values in
+    # one chunk only is read as float there), so the same column would be written in
+    # different formats, and the Parquet file needs the same types in every chunk
+    reader = pd.read_csv(dataset_path, chunksize=chunksize, dtype="string")
+
+    writer = None
+
+    try:
+        for i, data in enumerate(reader):
+            _clean_chunk(data)
+
+            if to_parquet:
+                table = pa.Table.from_pandas(data, preserve_index=False)
+                if writer is None:
+                    schema = pa.schema(
+                        [(name, pa.string()) for name in table.column_names]
+                    )
+                    writer = pq.ParquetWriter(output_path, schema, compression="zstd")
+                # Cast the columns that pandas left untyped (e.g. dates that are all
+                # missing in a chunk) to the text type of the file
+                writer.write_table(table.cast(writer.schema), row_group_size=chunksize)
+            else:
+                # Append the cleaned chunk to the output file, writing the header only once
+                data.to_csv(
+                    output_path,
+                    mode="w" if i == 0 else "a",
+                    header=(i == 0),
+                    index=False,
+                )
+    finally:
+        if writer is not None:
+            writer.close()
 
 
 # ---------------------------------------------------------------------------------------------------------------
 
 
-def split_dataset(dataset_path: str, n_chunks: int, output_dir: str) -> None:
+def _split_parquet(dataset_path: str, n_chunks: int, output_dir: str) -> Iterator[str]:
     """
-    Splits a large dataset into multiple smaller chunks and saves them as separate CSV files.
+    Splits a Parquet dataset into CSV chunks, streaming it one row batch at a time.
+    CSV is only written here, as it is the input format required by the RML mapping.
 
     Args:
-        dataset_path (str): The path to the CSV dataset file to split.
+        dataset_path (str): The path to the Parquet dataset file to split.
         n_chunks (int): The number of chunks to split the dataset into.
         output_dir (str): The directory where the chunked files should be saved.
 
-    Returns:
-        None
+    Yields:
+        str: The path of each chunk, once it is completely written.
+    """
+    parquet_file = pq.ParquetFile(dataset_path)
+
+    # Calculate the size of each chunk from the file metadata
+    chunk_size = parquet_file.metadata.num_rows // n_chunks
+
+    batches = parquet_file.iter_batches()
+    batch = None
+    for i in range(n_chunks):
+        # If it's the last chunk, include all remaining rows
+        remaining = None if i == n_chunks - 1 else chunk_size
+        chunk_path = os.path.join(output_dir, f"data_chunk_{i}.csv")
+        with open(chunk_path, "w", newline="") as chunk:
+            header = True
+            while remaining is None or remaining > 0:
+                # Move on to the next batch once the current one is written out
+                if batch is None or batch.num_rows == 0:
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                rows = batch if remaining is None else batch.slice(0, remaining)
+                batch = batch.slice(rows.num_rows)
+                if remaining is not None:
+                    remaining -= rows.num_rows
+
+                # Keep integer columns with missing values as integers in the CSV
+                rows.to_pandas(integer_object_nulls=True).to_csv(
+                    chunk, header=header, index=False
+                )
+                header = False
+
+            # Write the header alone if the chunk got no rows
+            if header:
+                pd.DataFrame(columns=parquet_file.schema_arrow.names).to_csv(
+                    chunk, index=False
+                )
+        yield chunk_path
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def iter_split_dataset(
+    dataset_path: str, n_chunks: int, output_dir: str
+) -> Iterator[str]:
     """
-    # Load the dataset
-    data = pd.read_csv(dataset_path, low_memory=False)
+    Splits a large dataset into multiple smaller chunks and saves them as separate CSV files,
+    yielding each chunk as soon as it is written so that it can be processed right away.
+    A CSV file is split line by line without being parsed, hence its fields must not contain
+    line breaks. A dataset whose path ends with ".parquet" is read as Parquet instead.
+
+    Args:
+        dataset_path (str): The path to the CSV or Parquet dataset file to split.
+        n_chunks (int): The number of chunks to split the dataset into.
+        output_dir (str): The directory where the chunked files should be saved.
+
+    Yields:
+        str: The path of each chunk, once it is completely written.
+    """
+    if os.fspath(dataset_path).endswith(".parquet"):
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        yield from _split_parquet(dataset_path, n_chunks, output_dir)
+        return
+
+    with open(dataset_path, "rb") as file:
+        # Skip the header, then count the rows by reading the file in 1 MB blocks
+        file.readline()
+        n_rows, last_block = 0, b""
+        for block in iter(functools.partial(file.read, 1 << 20), b""):
+            n_rows += block.count(b"\n")
+            last_block = block
+        # The last row has no line break if the file does not end with one
+        if last_block and not last_block.endswith(b"\n"):
+            n_rows += 1
 
     # Calculate the size of each chunk
-    chunk_size = len(data) // n_chunks
+    chunk_size = n_rows // n_chunks
 
     # Ensure the output directory exists
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
     # Split and save the chunks
-    for i in range(n_chunks):
-        start_index = i * chunk_size
-        # If it's the last chunk, include all remaining rows
-        if i == n_chunks - 1:
-            chunk = data.iloc[start_index:]
-        else:
-            chunk = data.iloc[start_index : start_index + chunk_size]
+    with open(dataset_path, "rb") as file:
+        header = file.readline()
+        for i in range(n_chunks):
+            # Save each chunk as a separate CSV file, starting with the header
+            chunk_path = os.path.join(output_dir, f"data_chunk_{i}.csv")
+            with open(chunk_path, "wb") as chunk:
+                chunk.write(header)
+                # If it's the last chunk, include all remaining rows
+                if i == n_chunks - 1:
+                    chunk.writelines(file)
+                else:
+                    chunk.writelines(itertools.islice(file, chunk_size))
+            yield chunk_path
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+def split_dataset(dataset_path: str, n_chunks: int, output_dir: str) -> None:
+    """
+    Splits a large dataset into multiple smaller chunks and saves them as separate CSV files.
+    See `iter_split_dataset` for the details.
+
+    Args:
+        dataset_path (str): The path to the CSV or Parquet dataset file to split.
+        n_chunks (int): The number of chunks to split the dataset into.
+        output_dir (str): The directory where the chunked files should be saved.
+
+    Returns:
+        None
+    """
+    for _ in iter_split_dataset(dataset_path, n_chunks, output_dir):
+        pass
 
-        # Save each chunk as a separate CSV file
-        chunk.to_csv(os.path.join(output_dir, f"data_chunk_{i}.csv"), index=False)
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(config_file: str) -> dict:
+    """
+    Reads and parses a JSON configuration file with orjson, caching the result so that the
+    same file is read only once. Errors are raised and not cached, so a missing or invalid
+    file is read again on the next call.
+
+    Args:
+        config_file (str): The path to the JSON configuration file.
+
+    Returns:
+        dict: A dictionary containing the configuration settings, shared by every call.
+    """
+    return orjson.loads(Path(config_file).read_bytes())
 
 
 # ---------------------------------------------------------------------------------------------------------------
@@ -334,7 +1164,8 @@ def split_dataset(dataset_path: str, n_chunks: int, output_dir: str) -> None:
 
 def load_config(config_file: str) -> dict:
     """
-    Loads a JSON configuration file.
+    Loads a JSON configuration file. The parsed configuration is cached, so that loading the
+    same file again does not read it another time, while every call gets its own copy.
 
     Args:
         config_file (str): The path to the JSON configuration file.
@@ -343,12 +1174,79 @@ def load_config(config_file: str) -> dict:
         dict: A dictionary containing the configuration settings.
     """
     try:
-        with open(config_file, "r") as file:
-            config = json.load(file)
-            return config
+        return copy.deepcopy(_read_config(config_file))
     except FileNotFoundError:
         logging.error(f"Error: The file {config_file} was not found.")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logging.error(f"Error: Failed to decode JSON from {config_file}: {e}")
     except Exception as e:
         logging.error(f"An unexpected error occurred: {e}")
+
+
+# ---------------------------------------------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """
+    Settings of the pipeline, read once from the configuration dictionary returned by
+    `load_config`, with the paths already turned into `Path` objects.
+
+    Attributes:
+        clean_input (Path): Path to the raw CSV file to clean.
+        clean_output (Path): Path where the cleaned dataset is saved.
+        split_input (Path): Path to the cleaned dataset to split.
+        n_chunks (int): Number of chunks to split the dataset into.
+        chunk_dir (Path): Directory where the CSV chunks are saved.
+        rml_path (Path): Path to the RML file template, or to a directory of templates.
+        rdf_dir (Path): Directory where the generated RDF files are saved.
+        mapper_path (Path): Path to the RMLMapper JAR file.
+        graphdb_url (str): URL of the GraphDB instance, without trailing slash.
+        graphdb_repo (str): Name of the GraphDB repository to upload the data to.
+        graphdb_import_dir (Path | None): Import directory of GraphDB, to load the RDF files
+            with a server-side import instead of uploading them, or None if not set.
+    """
+
+    clean_input: Path
+    clean_output: Path
+    split_input: Path
+    n_chunks: int
+    chunk_dir: Path
+    rml_path: Path
+    rdf_dir: Path
+    mapper_path: Path
+    graphdb_url: str
+    graphdb_repo: str
+    graphdb_import_dir: Path | None = None
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "PipelineConfig":
+        """
+        Builds the pipeline settings from a configuration dictionary.
+
+        Args:
+            config (dict): The configuration settings, as returned by `load_config`.
+
+        Returns:
+            PipelineConfig: The pipeline settings.
+
+        Raises:
+            KeyError: If a setting is missing from the configuration.
+        """
+        return cls(
+            clean_input=Path(config["clean_data"]["input"]),
+            clean_output=Path(config["clean_data"]["output"]),
+            split_input=Path(config["split_dataset"]["dataset_path"]),
+            n_chunks=int(config["split_dataset"]["n_chunks"]),
+            chunk_dir=Path(config["split_dataset"]["output_dir"]),
+            rml_path=Path(config["mapping"]["rml_path"]),
+            rdf_dir=Path(config["mapping"]["output_path"]),
+            mapper_path=Path(config["mapping"]["mapper_path"]),
+            graphdb_url=config["upload_to_graphDB"]["graphDB_url"].rstrip("/"),
+            graphdb_repo=config["upload_to_graphDB"]["graphDB_repo"],
+            graphdb_import_dir=(
+                Path(config["upload_to_graphDB"]["graphDB_import_dir"])
+                if config["upload_to_graphDB"].get("graphDB_import_dir")
+                else None
+            ),
+        )